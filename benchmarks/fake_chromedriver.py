@@ -0,0 +1,313 @@
+import re
+import time
+from functools import lru_cache
+from html.parser import HTMLParser
+from http.cookies import SimpleCookie
+from urllib.parse import urlencode, urljoin
+from urllib.request import Request, urlopen
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
+
+# Elements that never have a closing tag
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+
+# Selector scrap.py uses to find feed posts
+FEED_POST_SELECTOR = "div.feed-shared-update-v2"
+
+# Class of the element feed_server.py puts after each page, pointing at the next one
+LOAD_MORE_CLASS = "scaffold-finite-scroll__load-more"
+
+# One compound CSS selector part: tag, .class, #id or [attr], [attr='x'], [attr^='x']
+SELECTOR_TOKEN = re.compile(r"""([a-zA-Z][\w-]*)|\.([\w-]+)|#([\w-]+)|\[([\w-]+)(?:(\^?=)['"]?([^'"\]]*)['"]?)?\]""")
+
+
+@lru_cache(maxsize=None)
+def parse_selector(selector):
+    """
+    Parses a compound CSS selector (no combinators) into a list of checks.
+
+    Also returns the classes it requires, so callers with a class index can
+    narrow the candidates before running the checks.
+    """
+    checks = []
+    classes = []
+    position = 0
+    for match in SELECTOR_TOKEN.finditer(selector):
+        if match.start() != position:
+            break
+        position = match.end()
+        tag, cls, element_id, attr, op, value = match.groups()
+        if tag:
+            checks.append(lambda el, tag=tag.lower(): el.tag == tag)
+        elif cls:
+            classes.append(cls)
+            checks.append(lambda el, cls=cls: cls in el.attrs.get("class", "").split())
+        elif element_id:
+            checks.append(lambda el, element_id=element_id: el.attrs.get("id") == element_id)
+        elif op == "^=":
+            checks.append(lambda el, attr=attr, value=value: (el.attrs.get(attr) or "").startswith(value))
+        elif op == "=":
+            checks.append(lambda el, attr=attr, value=value: el.attrs.get(attr) == value)
+        else:
+            checks.append(lambda el, attr=attr: attr in el.attrs)
+    if position != len(selector.strip()) or not checks:
+        raise ValueError(f"Unsupported selector for the fake driver: {selector}")
+    return checks, classes
+
+
+def compile_locator(by, value):
+    if by == By.ID:
+        return [lambda el: el.attrs.get("id") == value], []
+    if by == By.CSS_SELECTOR:
+        return parse_selector(value)
+    raise ValueError(f"Unsupported locator strategy for the fake driver: {by}")
+
+
+class FakeElement:
+    """Minimal stand-in for selenium's WebElement backed by a parsed HTML tree."""
+
+    def __init__(self, tag, attrs, parent=None, driver=None):
+        self.tag = tag
+        self.attrs = {name: value if value is not None else "" for name, value in attrs}
+        self.parent = parent
+        self.children = []
+        self.driver = driver
+
+    @property
+    def text(self):
+        parts = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, str):
+                parts.append(node)
+            else:
+                stack.extend(reversed(node.children))
+        return " ".join("".join(parts).split())
+
+    def iter_descendants(self):
+        stack = list(reversed(self.children))
+        while stack:
+            node = stack.pop()
+            if isinstance(node, FakeElement):
+                yield node
+                stack.extend(reversed(node.children))
+
+    def get_attribute(self, name):
+        return self.attrs.get(name)
+
+    def iter_matches(self, by, value):
+        checks, _ = compile_locator(by, value)
+        return (el for el in self.iter_descendants() if all(check(el) for check in checks))
+
+    def find_elements(self, by=By.ID, value=None):
+        return list(self.iter_matches(by, value))
+
+    def find_element(self, by=By.ID, value=None):
+        element = next(self.iter_matches(by, value), None)
+        if element is None:
+            raise NoSuchElementException(f"Unable to locate element: {value}")
+        return element
+
+    def send_keys(self, *value):
+        self.attrs["value"] = self.attrs.get("value", "") + "".join(value)
+
+    def click(self):
+        # Only form submission is needed to drive the login flow
+        if self.tag == "button" and self.attrs.get("type", "submit") == "submit":
+            form = self.parent
+            while form is not None and form.tag != "form":
+                form = form.parent
+            if form is not None:
+                fields = {el.attrs["name"]: el.attrs.get("value", "") for el in form.iter_descendants() if el.tag == "input" and "name" in el.attrs}
+                self.driver.submit(form.attrs.get("action", ""), fields)
+
+
+class TreeBuilder(HTMLParser):
+    """Builds a FakeElement tree out of an HTML document or fragment."""
+
+    def __init__(self, driver):
+        super().__init__(convert_charrefs=True)
+        self.root = FakeElement("#document", [], driver=driver)
+        self.current = self.root
+        self.driver = driver
+        # Every element in document order, for the driver's index
+        self.elements = []
+
+    def handle_starttag(self, tag, attrs):
+        element = FakeElement(tag, attrs, parent=self.current, driver=self.driver)
+        self.current.children.append(element)
+        self.elements.append(element)
+        if tag not in VOID_ELEMENTS:
+            self.current = element
+
+    def handle_startendtag(self, tag, attrs):
+        element = FakeElement(tag, attrs, parent=self.current, driver=self.driver)
+        self.current.children.append(element)
+        self.elements.append(element)
+
+    def handle_endtag(self, tag):
+        node = self.current
+        while node is not self.root and node.tag != tag:
+            node = node.parent
+        if node is not self.root:
+            self.current = node.parent
+
+    def handle_data(self, data):
+        self.current.children.append(data)
+
+
+class FakeChromeDriver:
+    """
+    Drop-in replacement for webdriver.Chrome that talks to the local feed server.
+
+    It implements only the subset of the WebDriver API used by scrap.py. Requests
+    for https://www.linkedin.com are rewritten to base_url, and scrolling to the
+    bottom of the page fetches the next page of the feed, the way LinkedIn's
+    infinite scroll does.
+
+    Document-wide lookups go through an index of elements by class and id,
+    kept up to date as pages are spliced in, so the cost of the harness does
+    not grow with the size of the feed and drown out the cost of scrap.py.
+
+    It also records when scrap.py first scanned the feed (first_scan_at), when
+    it finished the pass that brought it to rate_posts posts (rate_posts_done_at)
+    and when it last finished a pass that found new posts (last_new_posts_at).
+    Timing a fixed number of posts from the first scan leaves out login and
+    navigation, and keeps the rate independent of the scrape window.
+    """
+
+    LINKEDIN_ORIGIN = "https://www.linkedin.com"
+
+    def __init__(self, base_url, rate_posts=None):
+        self.base_url = base_url.rstrip("/")
+        self.cookies = {}
+        self.current_url = None
+        self.document = None
+        self.class_index = {}
+        self.id_index = {}
+        self.page_loads = 0
+        self.rate_posts = rate_posts
+        self.first_scan_at = None
+        self.rate_posts_done_at = None
+        self.rate_posts_seen = None
+        self.last_new_posts_at = None
+        self.posts_seen = 0
+        self.extracting_new_posts = False
+
+    def _finish_extraction(self):
+        # The scraper processes the posts it found before scrolling again or quitting
+        if self.extracting_new_posts:
+            self.last_new_posts_at = time.perf_counter()
+            self.extracting_new_posts = False
+            if self.rate_posts and self.rate_posts_done_at is None and self.posts_seen >= self.rate_posts:
+                self.rate_posts_done_at = self.last_new_posts_at
+                self.rate_posts_seen = self.posts_seen
+
+    def _rewrite(self, url):
+        if url.startswith(self.LINKEDIN_ORIGIN):
+            return self.base_url + (url[len(self.LINKEDIN_ORIGIN):] or "/")
+        return urljoin(self.base_url + "/", url)
+
+    def _fetch(self, url, data=None):
+        request = Request(self._rewrite(url), data=data)
+        if self.cookies:
+            request.add_header("Cookie", "; ".join(f"{name}={cookie['value']}" for name, cookie in self.cookies.items()))
+        with urlopen(request) as response:
+            for header in response.headers.get_all("Set-Cookie") or []:
+                for name, morsel in SimpleCookie(header).items():
+                    self.cookies[name] = {"name": name, "value": morsel.value, "domain": ".linkedin.com", "path": morsel["path"] or "/"}
+            body = response.read().decode("utf-8")
+        self.page_loads += 1
+        builder = TreeBuilder(self)
+        builder.feed(body)
+        builder.close()
+        return builder
+
+    def _load_document(self, builder):
+        self.document = builder.root
+        self.class_index = {}
+        self.id_index = {}
+        self._index(builder.elements)
+
+    def _index(self, elements):
+        for element in elements:
+            for cls in element.attrs.get("class", "").split():
+                self.class_index.setdefault(cls, []).append(element)
+            if "id" in element.attrs:
+                self.id_index.setdefault(element.attrs["id"], []).append(element)
+
+    def _unindex(self, element):
+        for cls in element.attrs.get("class", "").split():
+            self.class_index[cls].remove(element)
+        if "id" in element.attrs:
+            self.id_index[element.attrs["id"]].remove(element)
+
+    def _iter_matches(self, by, value):
+        checks, classes = compile_locator(by, value)
+        if by == By.ID:
+            candidates = self.id_index.get(value, [])
+        elif classes:
+            candidates = self.class_index.get(classes[0], [])
+        else:
+            candidates = self.document.iter_descendants()
+        return (el for el in candidates if all(check(el) for check in checks))
+
+    def get(self, url):
+        self._load_document(self._fetch(url))
+        self.current_url = url
+
+    def refresh(self):
+        self.get(self.current_url)
+
+    def submit(self, action, fields):
+        self._load_document(self._fetch(urljoin(self.current_url, action), urlencode(fields).encode("utf-8")))
+
+    def maximize_window(self):
+        pass
+
+    def quit(self):
+        self._finish_extraction()
+        self.document = None
+
+    def execute_script(self, script, *args):
+        self._finish_extraction()
+        if "scrollTo" not in script or self.document is None:
+            return None
+        # Replace the load-more sentinel with the next page of posts, if there is one
+        sentinels = self.class_index.get(LOAD_MORE_CLASS)
+        if not sentinels:
+            return None
+        sentinel = sentinels[-1]
+        fragment = self._fetch(urljoin(self.current_url, sentinel.attrs["data-next"]))
+        container = sentinel.parent
+        index = container.children.index(sentinel)
+        for child in fragment.root.children:
+            if isinstance(child, FakeElement):
+                child.parent = container
+        container.children[index:index + 1] = fragment.root.children
+        # The sentinel is always last in the feed, so appending keeps the index in document order
+        self._unindex(sentinel)
+        self._index(fragment.elements)
+        return None
+
+    def find_element(self, by=By.ID, value=None):
+        element = next(self._iter_matches(by, value), None)
+        if element is None:
+            raise NoSuchElementException(f"Unable to locate element: {value}")
+        return element
+
+    def find_elements(self, by=By.ID, value=None):
+        elements = list(self._iter_matches(by, value))
+        if by == By.CSS_SELECTOR and value == FEED_POST_SELECTOR and self.first_scan_at is None:
+            self.first_scan_at = time.perf_counter()
+        if by == By.CSS_SELECTOR and value == FEED_POST_SELECTOR and len(elements) > self.posts_seen:
+            self.posts_seen = len(elements)
+            self.extracting_new_posts = True
+        return elements
+
+    def get_cookies(self):
+        return [dict(cookie) for cookie in self.cookies.values()]
+
+    def add_cookie(self, cookie):
+        self.cookies[cookie["name"]] = dict(cookie)
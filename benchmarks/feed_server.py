@@ -0,0 +1,166 @@
+import html
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Cookie handed out by the fake login form and checked on the home page
+SESSION_COOKIE = "li_at"
+SESSION_VALUE = "benchmark-session"
+
+LOGIN_PAGE = """<html><body>
+<form action="/checkpoint/lg/login-submit" method="post">
+  <input id="username" name="session_key" type="text">
+  <input id="password" name="session_password" type="password">
+  <button type="submit">Sign in</button>
+</form>
+</body></html>"""
+
+NAV_BAR = '<header><input class="global-nav-typeahead__input" placeholder="Search"></header>'
+
+HOME_PAGE = f"<html><body>{NAV_BAR}<main class=\"scaffold-layout__main\"></main></body></html>"
+
+GUEST_PAGE = """<html><body>
+<a class="nav__button-secondary" href="/login">Sign in</a>
+</body></html>"""
+
+
+class FeedConfig:
+    """Shape of the synthetic search results feed served by FeedServer."""
+
+    def __init__(self, total_posts=20000, page_size=25, email_ratio=0.6, page_latency_ms=0, position="Developer"):
+        self.total_posts = total_posts
+        self.page_size = page_size
+        self.email_ratio = email_ratio
+        self.page_latency_ms = page_latency_ms
+        self.position = position
+
+
+def render_post(index, config):
+    """Renders a single LinkedIn-style feed update."""
+    # Spread emails evenly across the feed, alternating between mailto links and plain text
+    has_email = int((index + 1) * config.email_ratio) != int(index * config.email_ratio)
+    email = f"recruiter{index}@company{index % 50}.example.com"
+    text = f"We are hiring a {config.position}! Post #{index}. Remote friendly, immediate joiners preferred."
+    mailto = ""
+    if has_email:
+        if index % 2 == 0:
+            mailto = f'<a href="mailto:{email}">{email}</a>'
+        else:
+            text += f" Send your resume to {email}"
+    return (
+        f'<div class="feed-shared-update-v2" data-urn="urn:li:activity:{7000000000000000000 + index}">'
+        f'<span class="update-components-actor__title">Recruiter {index}</span>'
+        f'<span class="update-components-actor__sub-description">{index % 24 + 1}h</span>'
+        f'<div class="update-components-text">{text}</div>'
+        f'{mailto}'
+        f'<a href="https://example.com/jobs/{index}">Apply</a>'
+        f'</div>'
+    )
+
+
+def render_feed_page(page, config, query=""):
+    """Renders one page of posts followed by a sentinel pointing at the next page."""
+    start = page * config.page_size
+    end = min(start + config.page_size, config.total_posts)
+    posts = "".join(render_post(i, config) for i in range(start, end))
+    if end < config.total_posts:
+        next_url = f"/search/results/content/?{query}&page={page + 1}" if query else f"/search/results/content/?page={page + 1}"
+        sentinel = f'<div class="scaffold-finite-scroll__load-more" data-next="{html.escape(next_url)}"></div>'
+    else:
+        sentinel = ""
+    return f'<div class="search-results-container">{posts}{sentinel}</div>'
+
+
+def render_jobs(results_wanted, config):
+    """Renders a JSON list of job board listings for the jobspy benchmark."""
+    sites = ["indeed", "linkedin", "zip_recruiter", "glassdoor", "google", "bayt", "naukri"]
+    return [
+        {
+            "id": f"job-{i}",
+            "site": sites[i % len(sites)],
+            "job_url": f"https://example.com/jobs/{i}",
+            "title": f"{config.position} {i}",
+            "company": f"Company {i % 50}",
+            "location": "Remote",
+            "date_posted": "2024-01-01",
+            "description": f"Looking for a {config.position}. Contact recruiter{i}@company{i % 50}.example.com",
+        }
+        for i in range(results_wanted)
+    ]
+
+
+class FeedRequestHandler(BaseHTTPRequestHandler):
+    """Serves the login flow, home page, paginated search feed and a jobs endpoint."""
+
+    def log_message(self, format, *args):
+        # Keep the benchmark output clean
+        pass
+
+    def _send(self, status, body, content_type="text/html; charset=utf-8", headers=None):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _has_session(self):
+        cookies = self.headers.get("Cookie", "")
+        return f"{SESSION_COOKIE}={SESSION_VALUE}" in cookies
+
+    def do_GET(self):
+        config = self.server.feed_config
+        url = urlparse(self.path)
+        params = parse_qs(url.query)
+
+        if url.path == "/login":
+            self._send(200, LOGIN_PAGE)
+        elif url.path in ("/", "/feed/"):
+            self._send(200, HOME_PAGE if self._has_session() else GUEST_PAGE)
+        elif url.path == "/search/results/content/":
+            if config.page_latency_ms:
+                time.sleep(config.page_latency_ms / 1000)
+            page = int(params.get("page", ["0"])[0])
+            query = "&".join(part for part in url.query.split("&") if not part.startswith("page="))
+            feed = render_feed_page(page, config, query)
+            # The first page is a full document, later pages are fragments fetched on scroll
+            self._send(200, f"<html><body>{NAV_BAR}<main>{feed}</main></body></html>" if page == 0 else feed)
+        elif url.path == "/jobs":
+            results_wanted = int(params.get("results_wanted", ["100"])[0])
+            self._send(200, json.dumps(render_jobs(results_wanted, config)), "application/json")
+        else:
+            self._send(404, "<html><body>Not found</body></html>")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        if urlparse(self.path).path == "/checkpoint/lg/login-submit":
+            self._send(200, HOME_PAGE, headers={"Set-Cookie": f"{SESSION_COOKIE}={SESSION_VALUE}; Path=/"})
+        else:
+            self._send(404, "<html><body>Not found</body></html>")
+
+
+class FeedServer:
+    """Runs the synthetic LinkedIn server on a background thread."""
+
+    def __init__(self, config, host="127.0.0.1", port=0):
+        self.httpd = ThreadingHTTPServer((host, port), FeedRequestHandler)
+        self.httpd.feed_config = config
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
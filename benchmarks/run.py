@@ -0,0 +1,288 @@
+import argparse
+import contextlib
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import types
+from unittest import mock
+from urllib.request import urlopen
+
+from feed_server import FeedConfig, FeedServer
+from fake_chromedriver import FakeChromeDriver
+from smtp_sink import PlainSMTP, SinkConfig, SMTPSink
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
+# Define ANSI color codes
+COLOR_GREEN = '\033[92m'
+COLOR_RED = '\033[91m'
+COLOR_BLUE = '\033[94m'
+COLOR_YELLOW = '\033[93m'
+COLOR_END = '\033[0m' # Reset color
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PHASES = ["scrape_linkedin", "send_emails", "scrape_jobspy"]
+
+
+def install_benchmark_creds():
+    """Registers throwaway credentials so the real creds.py is never read or sent anywhere."""
+    creds = types.ModuleType("creds")
+    creds.getEmail = lambda: "benchmark@example.com"
+    creds.getPassword = lambda: "benchmark"
+    creds.getSMTPUsername = lambda: "benchmark@example.com"
+    creds.getSMTPPassword = lambda: "benchmark"
+    sys.modules["creds"] = creds
+
+
+def reset_peak_rss():
+    """Resets the peak RSS counter on Linux. Returns False where that is not possible."""
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb():
+    """Returns the peak resident set size in megabytes, since the last reset where supported."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_phase(name, func, verbose):
+    """Runs one phase, capturing its wall time, span timings and peak RSS."""
+    import metrics
+    print(f"{COLOR_BLUE}Running {name}...{COLOR_END}")
+    metrics.reset()
+    # Without a reset the peak covers the whole process, including earlier phases
+    rss_scope = "phase" if reset_peak_rss() else "process"
+    start = time.perf_counter()
+    if verbose:
+        result = func()
+    else:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            result = func()
+    elapsed = time.perf_counter() - start
+    return result, {"phase": name, "seconds": elapsed, "peak_rss_mb": peak_rss_mb(), "peak_rss_scope": rss_scope, "spans": metrics.summary()}
+
+
+def rate(count, seconds):
+    return count / seconds if seconds > 0 else 0.0
+
+
+def bench_scrape_linkedin(args, scrap, feed_url):
+    drivers = []
+
+    def make_driver():
+        drivers.append(FakeChromeDriver(feed_url, rate_posts=args.rate_posts))
+        return drivers[-1]
+
+    with mock.patch.object(scrap, "webdriver", types.SimpleNamespace(Chrome=make_driver)), \
+            mock.patch.object(scrap, "SCRAPE_DURATION_MINUTES", args.scrape_seconds / 60), \
+            mock.patch.object(scrap, "SCROLL_PAUSE_SECONDS", args.scroll_pause):
+        data, stats = run_phase("scrape_linkedin", lambda: scrap.scrape_linkedin(args.position), args.verbose)
+
+    posts = len(data["posts_data"])
+    emails = len({email for post in data["posts_data"] for email in post["emails"]})
+    # Rates cover the first --rate-posts posts, timed from the first scan of the feed, so
+    # login is left out and scrap.py's per-scroll rescans cost the same for any window.
+    # If that many posts were never reached, fall back to the last pass that found new ones.
+    driver = drivers[-1]
+    rate_posts_reached = driver.rate_posts_done_at is not None
+    if rate_posts_reached:
+        rate_seconds = driver.rate_posts_done_at - driver.first_scan_at
+        rate_window = data["posts_data"][:driver.rate_posts_seen]
+    elif driver.last_new_posts_at is not None:
+        rate_seconds = driver.last_new_posts_at - driver.first_scan_at
+        rate_window = data["posts_data"]
+    else:
+        rate_seconds = 0.0
+        rate_window = []
+    rate_emails = len({email for post in rate_window for email in post["emails"]})
+    stats.update({
+        "posts": posts,
+        "emails_extracted": emails,
+        "page_loads": driver.page_loads,
+        "feed_exhausted": posts >= args.posts,
+        "rate_posts": len(rate_window),
+        "rate_posts_reached": rate_posts_reached,
+        "rate_seconds": rate_seconds,
+        "posts_per_sec": rate(len(rate_window), rate_seconds),
+        "emails_per_sec": rate(rate_emails, rate_seconds),
+    })
+    return stats
+
+
+def bench_send_emails(args, send_emails, sink):
+    # Seed recipients when the scrape phase did not produce them
+    filename = f"linkedin_posts_{args.position.replace(' ', '_')}.json"
+    if not os.path.exists(filename):
+        recipients = [f"recruiter{i}@company{i % 50}.example.com" for i in range(args.recipients)]
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump({"allemails": recipients, "posts_data": []}, f)
+
+    host, port = sink.address
+    with mock.patch.object(send_emails, "SMTP_SERVER", host), \
+            mock.patch.object(send_emails, "SMTP_PORT", port), \
+            mock.patch.object(send_emails.smtplib, "SMTP_SSL", PlainSMTP):
+        _, stats = run_phase("send_emails", lambda: send_emails.send_emails(args.position), args.verbose)
+
+    stats.update({
+        "sent": sink.delivered,
+        "failed": sink.rejected,
+        "bytes_sent": sink.bytes_received,
+        "messages_per_sec": rate(sink.delivered, stats["seconds"]),
+    })
+    return stats
+
+
+def load_jobspy_scraper():
+    """Imports jobspy/scraper.py by path, from its own directory so it finds ../config.json."""
+    cwd = os.getcwd()
+    os.chdir(os.path.join(REPO_ROOT, "jobspy"))
+    try:
+        spec = importlib.util.spec_from_file_location("jobspy_scraper", os.path.join(REPO_ROOT, "jobspy", "scraper.py"))
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    finally:
+        os.chdir(cwd)
+
+
+def make_jobspy_stub(feed_url, pandas):
+    """Builds a stand-in for the jobspy package whose scrape_jobs reads listings from the feed server."""
+    jobspy = types.ModuleType("jobspy")
+
+    def scrape_jobs(results_wanted=100, **kwargs):
+        with urlopen(f"{feed_url}/jobs?results_wanted={results_wanted}") as response:
+            return pandas.DataFrame(json.load(response))
+
+    jobspy.scrape_jobs = scrape_jobs
+    return jobspy
+
+
+def bench_scrape_jobspy(args, feed_url):
+    try:
+        import pandas
+    except ImportError as e:
+        print(f"{COLOR_YELLOW}Skipping scrape_jobspy: {str(e)}{COLOR_END}")
+        return None
+
+    # jobspy/scraper.py imports scrape_jobs at load time, so the stub must be in place first
+    with mock.patch.dict(sys.modules, {"jobspy": make_jobspy_stub(feed_url, pandas)}):
+        scraper = load_jobspy_scraper()
+        jobs, stats = run_phase(
+            "scrape_jobspy",
+            lambda: scraper.scrape_jobspy(args.position, results_wanted=args.jobs),
+            args.verbose,
+        )
+
+    count = 0 if jobs is None else len(jobs)
+    stats.update({"jobs": count, "jobs_per_sec": rate(count, stats["seconds"])})
+    return stats
+
+
+def print_report(results):
+    print(f"\n{COLOR_BLUE}=== Benchmark Report ==={COLOR_END}")
+    for stats in results:
+        print(f"{COLOR_BLUE}{stats['phase']}:{COLOR_END}")
+        for key, value in stats.items():
+            if key in ("phase", "spans"):
+                continue
+            if isinstance(value, float):
+                value = f"{value:.2f}"
+            print(f"  {key}: {value}")
+        for span_name, span in stats.get("spans", {}).items():
+            print(f"  span {span_name}: {span['count']} calls, {span['seconds']:.2f}s total")
+    print(f"{COLOR_BLUE}========================{COLOR_END}")
+
+
+def main():
+    os.chdir(REPO_ROOT)
+    sys.path.insert(0, REPO_ROOT)
+    install_benchmark_creds()
+    import scrap
+    import send_emails
+
+    positions = list(scrap.config.get("job_positions", {}).keys())
+
+    parser = argparse.ArgumentParser(description="Offline benchmark for scraping and sending throughput.")
+    parser.add_argument("--position", default=positions[0] if positions else None, help="Job position from config.json to benchmark.")
+    parser.add_argument("--phases", nargs="+", choices=PHASES, default=PHASES, help="Phases to run, in order.")
+    parser.add_argument("--posts", type=int, default=20000, help="Total posts in the synthetic feed.")
+    parser.add_argument("--rate-posts", type=int, default=5000, help="Number of posts that posts/sec and emails/sec are measured over.")
+    parser.add_argument("--page-size", type=int, default=25, help="Posts loaded per scroll.")
+    parser.add_argument("--email-ratio", type=float, default=0.6, help="Fraction of posts that contain an email address.")
+    parser.add_argument("--page-latency-ms", type=float, default=0, help="Delay before the feed server answers each page.")
+    parser.add_argument("--scrape-seconds", type=float, default=10, help="Scrape window (replaces the 2 minute production window).")
+    parser.add_argument("--scroll-pause", type=float, default=0, help="Pause after each scroll (replaces the 2 second production pause).")
+    parser.add_argument("--recipients", type=int, default=200, help="Recipients to seed when scrape_linkedin is not run.")
+    parser.add_argument("--smtp-latency-ms", type=float, default=0, help="Delay before the SMTP sink accepts each message.")
+    parser.add_argument("--smtp-failure-rate", type=float, default=0.0, help="Fraction of messages the SMTP sink rejects.")
+    parser.add_argument("--jobs", type=int, default=500, help="Job listings returned to scrape_jobspy.")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for SMTP failures.")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this JSON file.")
+    parser.add_argument("--verbose", action="store_true", help="Show the output of the benchmarked functions.")
+    args = parser.parse_args()
+
+    if args.position not in scrap.config.get("job_positions", {}):
+        print(f"{COLOR_RED}Error: Job position '{args.position}' not found in config.json.{COLOR_END}")
+        sys.exit(1)
+    if args.json_path:
+        args.json_path = os.path.abspath(args.json_path)
+
+    feed_config = FeedConfig(args.posts, args.page_size, args.email_ratio, args.page_latency_ms, args.position)
+    sink_config = SinkConfig(args.smtp_latency_ms, args.smtp_failure_rate, args.seed)
+
+    # Run inside a scratch directory so cookies, scraped data and sent_emails.json stay untouched
+    workdir = tempfile.mkdtemp(prefix="jobs_autoapply_bench_")
+    job_config = scrap.config["job_positions"][args.position]
+    resume_path = job_config.get("resume_path", scrap.config.get("default_resume_path"))
+    if resume_path and os.path.isfile(resume_path):
+        os.makedirs(os.path.join(workdir, os.path.dirname(resume_path)), exist_ok=True)
+        shutil.copy(resume_path, os.path.join(workdir, resume_path))
+
+    results = []
+    try:
+        os.chdir(workdir)
+        with FeedServer(feed_config) as feed, SMTPSink(sink_config) as sink:
+            for phase in args.phases:
+                if phase == "scrape_linkedin":
+                    stats = bench_scrape_linkedin(args, scrap, feed.base_url)
+                elif phase == "send_emails":
+                    stats = bench_send_emails(args, send_emails, sink)
+                else:
+                    stats = bench_scrape_jobspy(args, feed.base_url)
+                if stats:
+                    results.append(stats)
+    finally:
+        os.chdir(REPO_ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    print_report(results)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump({"args": vars(args), "results": results}, f, indent=2)
+        print(f"{COLOR_GREEN}Results saved to {args.json_path}{COLOR_END}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import random
+import smtplib
+import socketserver
+import threading
+import time
+
+
+class SinkConfig:
+    """Behaviour of the local SMTP sink."""
+
+    def __init__(self, latency_ms=0, failure_rate=0.0, seed=None):
+        self.latency_ms = latency_ms
+        self.failure_rate = failure_rate
+        self.random = random.Random(seed)
+
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """Speaks just enough SMTP for smtplib: EHLO, AUTH PLAIN, MAIL, RCPT, DATA, RSET, NOOP and QUIT."""
+
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+    def handle(self):
+        sink = self.server.sink
+        self.reply("220 localhost benchmark SMTP sink ready")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("utf-8", "replace").strip()
+            verb = command.split(" ", 1)[0].upper()
+
+            if verb == "EHLO":
+                self.reply("250-localhost")
+                self.reply("250-AUTH PLAIN")
+                self.reply("250 SIZE 52428800")
+            elif verb == "HELO":
+                self.reply("250 localhost")
+            elif verb == "AUTH":
+                # smtplib sends the PLAIN credentials inline, anything is accepted
+                if len(command.split(" ")) == 2:
+                    self.reply("334 ")
+                    self.rfile.readline()
+                self.reply("235 2.7.0 Authentication successful")
+            elif verb in ("MAIL", "RCPT", "RSET", "NOOP"):
+                self.reply("250 2.1.0 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                size = 0
+                while True:
+                    data = self.rfile.readline()
+                    if not data or data in (b".\r\n", b".\n"):
+                        break
+                    size += len(data)
+                if sink.config.latency_ms:
+                    time.sleep(sink.config.latency_ms / 1000)
+                with sink.lock:
+                    failed = sink.config.random.random() < sink.config.failure_rate
+                    if failed:
+                        sink.rejected += 1
+                    else:
+                        sink.delivered += 1
+                        sink.bytes_received += size
+                if failed:
+                    self.reply("451 4.3.0 Simulated temporary failure")
+                else:
+                    self.reply("250 2.0.0 Queued")
+            elif verb == "QUIT":
+                self.reply("221 2.0.0 Bye")
+                return
+            else:
+                self.reply("502 5.5.2 Command not recognized")
+
+
+class SMTPSink:
+    """Runs the SMTP sink on a background thread and counts what it receives."""
+
+    def __init__(self, config, host="127.0.0.1", port=0):
+        self.config = config
+        self.lock = threading.Lock()
+        self.delivered = 0
+        self.rejected = 0
+        self.bytes_received = 0
+        self.server = socketserver.ThreadingTCPServer((host, port), SMTPSinkHandler)
+        self.server.daemon_threads = True
+        self.server.sink = self
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def address(self):
+        return self.server.server_address[:2]
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class PlainSMTP(smtplib.SMTP):
+    """
+    Stands in for smtplib.SMTP_SSL when talking to the sink.
+
+    The sink has no certificate, so the implicit TLS wrapper is dropped and the
+    SSL context passed by send_emails.py is ignored.
+    """
+
+    def __init__(self, host="", port=0, context=None, **kwargs):
+        super().__init__(host, port, **kwargs)
@@ -27,6 +27,7 @@ import json
 import argparse
 from scrap import scrape_linkedin
 from send_emails import send_emails, load_sent_emails, save_sent_emails
+import metrics
 
 # Define ANSI color codes
 COLOR_GREEN = '\033[92m'
@@ -55,12 +56,15 @@ if __name__ == "__main__":
     parser.add_argument("--position", required=True, help="The target job position (must match a key in config.json).")
     parser.add_argument("--apply", action="store_true", help="Set this flag to send emails after scraping.")
     parser.add_argument("--apply-only", action="store_true", help="Set this flag to skip scraping and only send emails to available addresses.")
+    parser.add_argument("--trace-file", default=metrics.TRACE_FILE, help="JSONL file that timing spans are appended to.")
+    parser.add_argument("--metrics-file", default=metrics.METRICS_FILE, help="Prometheus textfile that the run's counters and latency histograms are written to.")
 
     args = parser.parse_args()
 
     target_job_position = args.position
     send_emails_flag = args.apply
     apply_only_flag = args.apply_only
+    metrics.configure(trace_file=args.trace_file, metrics_file=args.metrics_file)
 
     # Load configuration
     config = load_config()
@@ -75,30 +79,37 @@ if __name__ == "__main__":
 
     print(f"{COLOR_BLUE}Starting job search for: {target_job_position}{COLOR_END}")
 
-    scraped_data = None
-    # Step 1: Scrape LinkedIn for emails unless --apply-only flag is set
-    if not apply_only_flag:
-        print(f"\n{COLOR_BLUE}Running LinkedIn scraper...{COLOR_END}")
-        scraped_data = scrape_linkedin(target_job_position)
-        print(f"{COLOR_GREEN}LinkedIn scraping complete.{COLOR_END}")
-    else:
-        print(f"\n{COLOR_YELLOW}Scraping skipped (--apply-only flag is set).{COLOR_END}")
-
-    # Step 2: Send emails to collected addresses if --apply flag is set
-    if send_emails_flag or apply_only_flag: # Send emails if either --apply or --apply-only is set
-        # If apply_only, load emails from the existing file
-        if apply_only_flag and not scraped_data:
-             # Need to load emails if scraping was skipped
-             # The send_emails function already loads from linkedin_posts.json, so no need to load here
-             pass # send_emails will handle loading
-
-        print(f"\n{COLOR_BLUE}Running email sender...{COLOR_END}")
-        # The send_emails function will load emails from linkedin_posts.json
-        send_emails(target_job_position)
-        print(f"{COLOR_GREEN}Email sending complete.{COLOR_END}")
-
-    else:
-        print(f"\n{COLOR_BLUE}Email sending skipped (--apply flag not set and --apply-only flag not set).{COLOR_END}")
-
+    try:
+        scraped_data = None
+        # Step 1: Scrape LinkedIn for emails unless --apply-only flag is set
+        if not apply_only_flag:
+            print(f"\n{COLOR_BLUE}Running LinkedIn scraper...{COLOR_END}")
+            with metrics.span("scrape_linkedin", position=target_job_position):
+                scraped_data = scrape_linkedin(target_job_position)
+            print(f"{COLOR_GREEN}LinkedIn scraping complete.{COLOR_END}")
+        else:
+            print(f"\n{COLOR_YELLOW}Scraping skipped (--apply-only flag is set).{COLOR_END}")
+
+        # Step 2: Send emails to collected addresses if --apply flag is set
+        if send_emails_flag or apply_only_flag: # Send emails if either --apply or --apply-only is set
+            # If apply_only, load emails from the existing file
+            if apply_only_flag and not scraped_data:
+                 # Need to load emails if scraping was skipped
+                 # The send_emails function already loads from linkedin_posts.json, so no need to load here
+                 pass # send_emails will handle loading
+
+            print(f"\n{COLOR_BLUE}Running email sender...{COLOR_END}")
+            # The send_emails function will load emails from linkedin_posts.json
+            with metrics.span("send_emails", position=target_job_position):
+                send_emails(target_job_position)
+            print(f"{COLOR_GREEN}Email sending complete.{COLOR_END}")
+
+        else:
+            print(f"\n{COLOR_BLUE}Email sending skipped (--apply flag not set and --apply-only flag not set).{COLOR_END}")
+
+    finally:
+        # Export even when a phase fails, those are the runs worth diagnosing
+        if metrics.export_metrics():
+            print(f"{COLOR_BLUE}Timing spans appended to {args.trace_file} and metrics written to {args.metrics_file}.{COLOR_END}")
 
     print(f"\n{COLOR_BLUE}Job search and email campaign finished.{COLOR_END}")
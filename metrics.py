@@ -0,0 +1,199 @@
+import json
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime
+
+# Define ANSI color codes
+COLOR_YELLOW = '\033[93m'
+COLOR_END = '\033[0m' # Reset color
+
+# Default output files, can be changed with configure()
+TRACE_FILE = "run_trace.jsonl"
+METRICS_FILE = "run_metrics.prom"
+
+# Prefix for every exported Prometheus metric
+METRIC_PREFIX = "jobs_autoapply_"
+
+# Counters that are always exported, even when they stay at zero
+COUNTERS = {
+    "posts_scraped_total": "LinkedIn posts scraped.",
+    "emails_found_total": "Unique email addresses saved from scraped posts.",
+    "emails_sent_total": "Emails sent successfully.",
+    "failures_total": "Failed operations, by operation.",
+    "retries_total": "Retried operations, by operation.",
+}
+
+# Histogram buckets for span durations, in seconds
+# The top buckets cover the scrape_linkedin phase, which runs for the whole 2 minute window plus login
+DURATION_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 180, 300, 600]
+
+RUN_ID = uuid.uuid4().hex
+
+counters = {}
+histograms = {}
+active_spans = []
+trace_write_failed = False
+
+
+class Span:
+    """A timed operation. Use set() to attach attributes and fail() to mark it as failed."""
+
+    def __init__(self, name, parent, attributes):
+        self.name = name
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent = parent
+        self.attributes = attributes
+        self.status = "ok"
+        self.error = None
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def fail(self, error):
+        self.status = "error"
+        self.error = str(error)
+
+
+def configure(trace_file=None, metrics_file=None):
+    """Sets where spans and the metrics snapshot are written."""
+    global TRACE_FILE, METRICS_FILE
+    if trace_file:
+        TRACE_FILE = trace_file
+    if metrics_file:
+        METRICS_FILE = metrics_file
+
+
+def reset():
+    """Clears all counters and histograms."""
+    counters.clear()
+    histograms.clear()
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def increment(name, amount=1, **labels):
+    """Adds amount to a counter, e.g. increment("failures_total", operation="sendmail")."""
+    key = (name, _label_key(labels))
+    counters[key] = counters.get(key, 0) + amount
+
+
+def observe(span_name, seconds):
+    """Records a span duration in the span latency histogram."""
+    histogram = histograms.setdefault(span_name, {"buckets": [0] * len(DURATION_BUCKETS), "sum": 0.0, "count": 0})
+    for i, bound in enumerate(DURATION_BUCKETS):
+        if seconds <= bound:
+            histogram["buckets"][i] += 1
+    histogram["sum"] += seconds
+    histogram["count"] += 1
+
+
+def _write_trace(record):
+    global trace_write_failed
+    try:
+        with open(TRACE_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+    except OSError as e:
+        # Tracing must never break a run, warn once instead of on every span
+        if not trace_write_failed:
+            print(f"{COLOR_YELLOW}Warning: Could not write trace to {TRACE_FILE}: {str(e)}{COLOR_END}")
+        trace_write_failed = True
+
+
+@contextmanager
+def span(name, **attributes):
+    """Times the enclosed block, writes it to the trace file and records its duration."""
+    current = Span(name, active_spans[-1] if active_spans else None, attributes)
+    active_spans.append(current)
+    started_at = datetime.now().astimezone().isoformat()
+    start = time.perf_counter()
+    try:
+        yield current
+    except BaseException as e:
+        current.fail(e)
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        active_spans.pop()
+        observe(name, duration)
+        _write_trace({
+            "run_id": RUN_ID,
+            "span": name,
+            "span_id": current.span_id,
+            "parent": current.parent.name if current.parent else None,
+            "parent_id": current.parent.span_id if current.parent else None,
+            "start": started_at,
+            "duration_seconds": round(duration, 6),
+            "status": current.status,
+            "error": current.error,
+            "attributes": current.attributes,
+        })
+
+
+def summary():
+    """Returns the number of calls and total seconds spent in each span."""
+    return {name: {"count": h["count"], "seconds": h["sum"]} for name, h in histograms.items()}
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def render_metrics():
+    """Renders all counters and histograms in the Prometheus text exposition format."""
+    lines = []
+    names = list(COUNTERS) + sorted({name for name, _ in counters} - set(COUNTERS))
+    for name in names:
+        metric = METRIC_PREFIX + name
+        lines.append(f"# HELP {metric} {COUNTERS.get(name, name)}")
+        lines.append(f"# TYPE {metric} counter")
+        samples = sorted((labels, value) for (counter, labels), value in counters.items() if counter == name)
+        if not samples and name in COUNTERS:
+            samples = [((), 0)]
+        for labels, value in samples:
+            lines.append(f"{metric}{_format_labels(labels)} {value}")
+
+    metric = METRIC_PREFIX + "span_duration_seconds"
+    lines.append(f"# HELP {metric} Duration of instrumented spans.")
+    lines.append(f"# TYPE {metric} histogram")
+    for span_name in sorted(histograms):
+        histogram = histograms[span_name]
+        for bound, count in zip(DURATION_BUCKETS, histogram["buckets"]):
+            lines.append(f'{metric}_bucket{{span="{_escape(span_name)}",le="{bound}"}} {count}')
+        lines.append(f'{metric}_bucket{{span="{_escape(span_name)}",le="+Inf"}} {histogram["count"]}')
+        lines.append(f'{metric}_sum{{span="{_escape(span_name)}"}} {histogram["sum"]}')
+        lines.append(f'{metric}_count{{span="{_escape(span_name)}"}} {histogram["count"]}')
+
+    metric = METRIC_PREFIX + "last_run_timestamp_seconds"
+    lines.append(f"# HELP {metric} Time the metrics snapshot was written.")
+    lines.append(f"# TYPE {metric} gauge")
+    lines.append(f"{metric} {time.time()}")
+    return "\n".join(lines) + "\n"
+
+
+def export_metrics(path=None):
+    """
+    Writes the metrics snapshot, replacing the file atomically so collectors never read half a file.
+
+    Returns the path written, or None if the file could not be written.
+    """
+    path = path or METRICS_FILE
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(render_metrics())
+        os.replace(tmp_path, path)
+    except OSError as e:
+        # Like tracing, exporting metrics must never break a run
+        print(f"{COLOR_YELLOW}Warning: Could not write metrics to {path}: {str(e)}{COLOR_END}")
+        return None
+    return path
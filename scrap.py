@@ -9,6 +9,7 @@ import time
 from datetime import datetime, timedelta
 import creds
 import os
+import metrics
 
 # Define ANSI color codes
 COLOR_GREEN = '\033[92m'
@@ -31,6 +32,11 @@ def load_config(config_path="config.json"):
 
 config = load_config()
 
+# How long to keep scrolling the search results feed, and how long to pause
+# after each scroll so LinkedIn can load the next batch of posts
+SCRAPE_DURATION_MINUTES = 2
+SCROLL_PAUSE_SECONDS = 2
+
 def save_cookies(driver):
     """Saves browser cookies to a JSON file."""
     with open("linkedin_cookies.json", "w") as f:
@@ -56,22 +62,27 @@ def load_cookies(driver):
 
 def perform_login(driver):
     """Performs login on LinkedIn."""
-    driver.get("https://www.linkedin.com/login")
-    try:
-        WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "username")))
-        driver.find_element(By.ID, "username").send_keys(creds.getEmail())
-        driver.find_element(By.ID, "password").send_keys(creds.getPassword())
-        driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-        # Wait for login to complete by checking for a common element on the homepage
-        WebDriverWait(driver, 20).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, "input.global-nav-typeahead__input"))
-        )
-        save_cookies(driver)
-        print(f"{COLOR_GREEN}Login successful. Cookies saved.{COLOR_END}")
-    except TimeoutException:
-        print(f"{COLOR_RED}Login timeout. Check credentials or 2FA.{COLOR_END}")
-    except Exception as e:
-        print(f"{COLOR_RED}An error occurred during login: {str(e)}{COLOR_END}")
+    with metrics.span("linkedin_login") as span:
+        driver.get("https://www.linkedin.com/login")
+        try:
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.ID, "username")))
+            driver.find_element(By.ID, "username").send_keys(creds.getEmail())
+            driver.find_element(By.ID, "password").send_keys(creds.getPassword())
+            driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+            # Wait for login to complete by checking for a common element on the homepage
+            WebDriverWait(driver, 20).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, "input.global-nav-typeahead__input"))
+            )
+            save_cookies(driver)
+            print(f"{COLOR_GREEN}Login successful. Cookies saved.{COLOR_END}")
+        except TimeoutException:
+            span.fail("timeout")
+            metrics.increment("failures_total", operation="login")
+            print(f"{COLOR_RED}Login timeout. Check credentials or 2FA.{COLOR_END}")
+        except Exception as e:
+            span.fail(e)
+            metrics.increment("failures_total", operation="login")
+            print(f"{COLOR_RED}An error occurred during login: {str(e)}{COLOR_END}")
 
 
 def scrape_linkedin(job_position):
@@ -83,14 +94,20 @@ def scrape_linkedin(job_position):
     # Attempt to reuse existing session using cookies
     driver.get("https://www.linkedin.com")
     if os.path.exists("linkedin_cookies.json") and load_cookies(driver):
-        driver.refresh()  # Refresh to apply cookies
-        try:
-            # Check if session is still valid
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input.global-nav-typeahead__input"))
-            )
-            print(f"{COLOR_GREEN}Session reused successfully.{COLOR_END}")
-        except TimeoutException:
+        session_valid = True
+        with metrics.span("linkedin_cookie_reuse") as span:
+            driver.refresh()  # Refresh to apply cookies
+            try:
+                # Check if session is still valid
+                WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "input.global-nav-typeahead__input"))
+                )
+                print(f"{COLOR_GREEN}Session reused successfully.{COLOR_END}")
+            except TimeoutException:
+                session_valid = False
+            span.set(session_valid=session_valid)
+        if not session_valid:
+            metrics.increment("retries_total", operation="login")
             print(f"{COLOR_BLUE}Session expired. Performing fresh login.{COLOR_END}")
             perform_login(driver)
     else:
@@ -117,69 +134,79 @@ def scrape_linkedin(job_position):
     posts_data = []
     processed_posts = set()
     allemails = []
+    scroll_iteration = 0
     start_time = datetime.now()
-    # Scrape for a fixed duration (e.g., 2 minutes) to avoid infinite loops
-    end_time = start_time + timedelta(minutes=2)
+    # Scrape for a fixed duration to avoid infinite loops
+    end_time = start_time + timedelta(minutes=SCRAPE_DURATION_MINUTES)
 
     print(f"{COLOR_BLUE}Starting to scrape LinkedIn posts...{COLOR_END}")
     try:
         while datetime.now() < end_time:
-            # Scroll down to load more posts
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2) # Give time for new content to load
-
-            try:
-                # Wait for new posts to appear
-                WebDriverWait(driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "div.feed-shared-update-v2"))
-                )
-            except TimeoutException:
-                print(f"{COLOR_BLUE}No new posts loaded after scrolling or end of feed reached.{COLOR_END}")
-                break # Exit loop if no new posts load
-
-            # Find all post elements
-            posts = driver.find_elements(By.CSS_SELECTOR, "div.feed-shared-update-v2")
+            scroll_iteration += 1
+            with metrics.span("scroll_iteration", iteration=scroll_iteration) as span:
+                # Scroll down to load more posts
+                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                time.sleep(SCROLL_PAUSE_SECONDS) # Give time for new content to load
 
-            # Process each post
-            for post in posts:
                 try:
-                    post_id = post.get_attribute("data-urn")
-                    if post_id in processed_posts:
-                        continue # Skip already processed posts
-                    processed_posts.add(post_id)
-
-                    # Extract post details
-                    name = post.find_element(By.CSS_SELECTOR, "span.update-components-actor__title").text
-                    date = post.find_element(By.CSS_SELECTOR, "span.update-components-actor__sub-description").text
-                    content = post.find_element(By.CSS_SELECTOR, "div.update-components-text").text
-
-                    # Extract emails from mailto links
-                    email_links = post.find_elements(By.CSS_SELECTOR, "a[href^='mailto:']")
-                    emails = [link.get_attribute("href").split(":")[1] for link in email_links]
-                    allemails.extend(emails) # Add to the overall email list
-
-                    # Extract emails from text content using regex
-                    text_emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', content)
-                    combined_emails = list(set(emails + text_emails)) # Combine and deduplicate emails for this post
-
-                    # Extract all links from the post
-                    all_links = [link.get_attribute("href") for link in post.find_elements(By.CSS_SELECTOR, "a[href]")]
-
-                    # Append extracted data to the list
-                    posts_data.append({
-                        "name": name,
-                        "date": date,
-                        "post_text": content,
-                        "emails": combined_emails,
-                        "links": list(set(all_links)), # Deduplicate links
-                        "post_id": post_id
-                    })
-
-                except NoSuchElementException:
-                    # Skip posts that don't have the expected elements
-                    continue
-                except Exception as e:
-                    print(f"{COLOR_RED}Error processing post {post_id}: {str(e)}{COLOR_END}")
+                    # Wait for new posts to appear
+                    WebDriverWait(driver, 10).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, "div.feed-shared-update-v2"))
+                    )
+                except TimeoutException:
+                    span.set(outcome="end_of_feed")
+                    print(f"{COLOR_BLUE}No new posts loaded after scrolling or end of feed reached.{COLOR_END}")
+                    break # Exit loop if no new posts load
+
+            with metrics.span("extract_posts", iteration=scroll_iteration) as span:
+                # Find all post elements
+                posts = driver.find_elements(By.CSS_SELECTOR, "div.feed-shared-update-v2")
+                posts_before = len(posts_data)
+
+                # Process each post
+                for post in posts:
+                    try:
+                        post_id = post.get_attribute("data-urn")
+                        if post_id in processed_posts:
+                            continue # Skip already processed posts
+                        processed_posts.add(post_id)
+
+                        # Extract post details
+                        name = post.find_element(By.CSS_SELECTOR, "span.update-components-actor__title").text
+                        date = post.find_element(By.CSS_SELECTOR, "span.update-components-actor__sub-description").text
+                        content = post.find_element(By.CSS_SELECTOR, "div.update-components-text").text
+
+                        # Extract emails from mailto links
+                        email_links = post.find_elements(By.CSS_SELECTOR, "a[href^='mailto:']")
+                        emails = [link.get_attribute("href").split(":")[1] for link in email_links]
+                        allemails.extend(emails) # Add to the overall email list
+
+                        # Extract emails from text content using regex
+                        text_emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', content)
+                        combined_emails = list(set(emails + text_emails)) # Combine and deduplicate emails for this post
+
+                        # Extract all links from the post
+                        all_links = [link.get_attribute("href") for link in post.find_elements(By.CSS_SELECTOR, "a[href]")]
+
+                        # Append extracted data to the list
+                        posts_data.append({
+                            "name": name,
+                            "date": date,
+                            "post_text": content,
+                            "emails": combined_emails,
+                            "links": list(set(all_links)), # Deduplicate links
+                            "post_id": post_id
+                        })
+                        metrics.increment("posts_scraped_total")
+
+                    except NoSuchElementException:
+                        # Skip posts that don't have the expected elements
+                        continue
+                    except Exception as e:
+                        metrics.increment("failures_total", operation="extract_post")
+                        print(f"{COLOR_RED}Error processing post {post_id}: {str(e)}{COLOR_END}")
+
+                span.set(posts_found=len(posts), new_posts=len(posts_data) - posts_before)
 
 
     finally:
@@ -193,14 +220,18 @@ def scrape_linkedin(job_position):
         'allemails': list(set(allemails)), # Deduplicate final list of all emails
         'posts_data': posts_data
     }
+    # Count the addresses that are actually saved, matching the summary below
+    metrics.increment("emails_found_total", len(data['allemails']))
 
     # Define the filename based on the job position
     filename = f"linkedin_posts_{job_position.replace(' ', '_')}.json"
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with metrics.span("write_json", filename=filename, posts=len(posts_data)):
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
 
-    print(f"{COLOR_GREEN}Scraped {len(posts_data)} posts and found {len(data['allemails'])} unique emails in 2 minutes. Data saved to {filename}{COLOR_END}")
+    elapsed = (datetime.now() - start_time).total_seconds()
+    print(f"{COLOR_GREEN}Scraped {len(posts_data)} posts and found {len(data['allemails'])} unique emails in {elapsed:.0f} seconds. Data saved to {filename}{COLOR_END}")
     return data
 
 # Example usage if the script is run directly
@@ -211,5 +242,6 @@ if __name__ == "__main__":
     if job_position_to_scrape:
         print(f"{COLOR_BLUE}Running scraper in standalone mode for 'Flutter Developer'...{COLOR_END}")
         scrape_linkedin("Flutter Developer")
+        metrics.export_metrics()
     else:
         print(f"{COLOR_RED}Job position 'Flutter Developer' not found in config.json. Cannot run scraper in standalone mode.{COLOR_END}")
@@ -9,6 +9,7 @@ from email.mime.base import MIMEBase
 from email import encoders
 from datetime import datetime
 import creds
+import metrics
 
 # Define ANSI color codes
 COLOR_GREEN = '\033[92m'
@@ -158,9 +159,12 @@ def send_emails(job_position):
 
     try:
         # Connect to the SMTP server and login
-        with smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT, context=context) as server:
-            print(f"\n{COLOR_BLUE}Connecting to SMTP server...{COLOR_END}")
-            server.login(SMTP_USERNAME, SMTP_PASSWORD)
+        print(f"\n{COLOR_BLUE}Connecting to SMTP server...{COLOR_END}")
+        with metrics.span("smtp_connect", server=SMTP_SERVER, port=SMTP_PORT):
+            server = smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT, context=context)
+        with server:
+            with metrics.span("smtp_login"):
+                server.login(SMTP_USERNAME, SMTP_PASSWORD)
             print(f"{COLOR_GREEN}Successfully authenticated with SMTP server.{COLOR_END}\n")
 
             # Send email to each recipient
@@ -179,7 +183,9 @@ def send_emails(job_position):
 
                     # Send the email
                     print(f"[{datetime.now().strftime('%H:%M:%S')}] ({idx}/{total_to_send}) Sending to {receiver}...", end=" ")
-                    server.sendmail(SMTP_USERNAME, receiver, msg.as_string())
+                    with metrics.span("sendmail", recipient_index=idx):
+                        server.sendmail(SMTP_USERNAME, receiver, msg.as_string())
+                    metrics.increment("emails_sent_total")
                     sent_count += 1
                     sent_emails_list.append(receiver) # Add to the list of sent emails
                     print(f"{COLOR_GREEN}SUCCESS{COLOR_END}")
@@ -188,10 +194,12 @@ def send_emails(job_position):
                     # Handle errors for individual emails
                     failed_count += 1
                     failed_emails.append(receiver)
+                    metrics.increment("failures_total", operation="sendmail")
                     print(f"{COLOR_RED}FAILED - {str(e)}{COLOR_END}")
 
     except Exception as e:
         # Handle fatal SMTP connection or login errors
+        metrics.increment("failures_total", operation="smtp_session")
         print(f"\n{COLOR_RED}Fatal SMTP error: {str(e)}{COLOR_END}")
         # Save the list of sent emails even if a fatal error occurs
         save_sent_emails(sent_emails_list)
@@ -225,3 +233,4 @@ if __name__ == "__main__":
     # You would need to ensure linkedin_posts.json exists with emails for this to work
     print(f"{COLOR_BLUE}Running email sender in standalone mode for 'Flutter Developer'...{COLOR_END}")
     send_emails("Flutter Developer")
+    metrics.export_metrics()